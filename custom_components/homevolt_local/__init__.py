@@ -146,29 +146,37 @@ SERVICE_SET_FULL_SOLAR_EXPORT_SCHEMA = vol.Schema(
 
 # ISO 8601 datetime pattern (YYYY-MM-DDTHH:mm:ss)
 ISO8601_DATETIME_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}$")
+ISO8601_DATETIME_LENGTH = 19
 
 
 def validate_iso8601_datetime(value: str) -> str:
     """Validate ISO 8601 datetime string to prevent command injection."""
     if not isinstance(value, str):
         raise vol.Invalid(f"Expected string, got {type(value).__name__}")
-    if not ISO8601_DATETIME_PATTERN.match(value):
+    # Length check rejects most malformed input without running the regex, and
+    # also catches the trailing newline that "$" would otherwise accept
+    if len(value) != ISO8601_DATETIME_LENGTH or not ISO8601_DATETIME_PATTERN.match(value):
         raise vol.Invalid(f"Invalid datetime format: {value}. Expected YYYY-MM-DDTHH:mm:ss")
     return value
 
 
+# Shared schedule entry field validators (power values in W)
+_SCHEDULE_SOC = vol.All(vol.Coerce(int), vol.Range(min=0, max=100))
+_SCHEDULE_POWER = vol.All(vol.Coerce(int), vol.Range(min=0, max=25000))
+_SCHEDULE_SIGNED_POWER = vol.All(vol.Coerce(int), vol.Range(min=-25000, max=25000))
+
 SCHEDULE_ENTRY_SCHEMA = vol.Schema(
     {
         vol.Required("type"): vol.All(vol.Coerce(int), vol.Range(min=0, max=9)),
         vol.Optional("from_time"): validate_iso8601_datetime,
         vol.Optional("to_time"): validate_iso8601_datetime,
-        vol.Optional("min_soc"): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
-        vol.Optional("max_soc"): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
-        vol.Optional("setpoint"): vol.All(vol.Coerce(int), vol.Range(min=-25000, max=25000)),
-        vol.Optional("max_charge"): vol.All(vol.Coerce(int), vol.Range(min=0, max=25000)),
-        vol.Optional("max_discharge"): vol.All(vol.Coerce(int), vol.Range(min=0, max=25000)),
-        vol.Optional("import_limit"): vol.All(vol.Coerce(int), vol.Range(min=-25000, max=25000)),
-        vol.Optional("export_limit"): vol.All(vol.Coerce(int), vol.Range(min=-25000, max=25000)),
+        vol.Optional("min_soc"): _SCHEDULE_SOC,
+        vol.Optional("max_soc"): _SCHEDULE_SOC,
+        vol.Optional("setpoint"): _SCHEDULE_SIGNED_POWER,
+        vol.Optional("max_charge"): _SCHEDULE_POWER,
+        vol.Optional("max_discharge"): _SCHEDULE_POWER,
+        vol.Optional("import_limit"): _SCHEDULE_SIGNED_POWER,
+        vol.Optional("export_limit"): _SCHEDULE_SIGNED_POWER,
     }
 )
 
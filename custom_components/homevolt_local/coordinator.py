@@ -66,6 +66,15 @@ class HomevoltCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._host = host
         self._initial_data = initial_data
 
+    def _ems_list(self) -> list[Any] | None:
+        """Return the nested EMS unit list, or None if unavailable."""
+        source = self.data or self._initial_data
+        ems_data = source.get("ems") if isinstance(source, dict) else None
+        if not isinstance(ems_data, dict):
+            return None
+        ems_list = ems_data.get("ems")
+        return ems_list if isinstance(ems_list, list) else None
+
     @property
     def device_id(self) -> str:
         """Return the device ID."""
@@ -119,13 +128,8 @@ class HomevoltCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         A device is considered a leader if the ems list contains more than one unit,
         meaning it has visibility into other devices in the cluster.
         """
-        ems_data = self.data.get("ems", {}) if self.data else self._initial_data.get("ems", {})
-        if not isinstance(ems_data, dict):
-            return False
-        ems_list = ems_data.get("ems", [])
-        if not isinstance(ems_list, list):
-            return False
-        return len(ems_list) > 1
+        ems_list = self._ems_list()
+        return ems_list is not None and len(ems_list) > 1
 
     @property
     def cluster_id(self) -> str:
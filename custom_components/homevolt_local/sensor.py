@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -37,18 +39,20 @@ PARALLEL_UPDATES = 1
 
 # Schedule control mode types from Battery Control Guide
 # https://github.com/tibber/homevolt-local-api-doc/blob/main/BATTERY_CONTROL_GUIDE.md
-SCHEDULE_CONTROL_MODES: dict[int, str] = {
-    0: "idle",
-    1: "inverter_charge",
-    2: "inverter_discharge",
-    3: "grid_charge",
-    4: "grid_discharge",
-    5: "grid_charge_discharge",
-    6: "frequency_reserve",
-    7: "solar_charge",
-    8: "solar_charge_discharge",
-    9: "full_solar_export",
-}
+SCHEDULE_CONTROL_MODES: Mapping[int, str] = MappingProxyType(
+    {
+        0: "idle",
+        1: "inverter_charge",
+        2: "inverter_discharge",
+        3: "grid_charge",
+        4: "grid_discharge",
+        5: "grid_charge_discharge",
+        6: "frequency_reserve",
+        7: "solar_charge",
+        8: "solar_charge_discharge",
+        9: "full_solar_export",
+    }
+)
 
 
 # Helper functions to extract data from nested API responses
@@ -195,6 +199,15 @@ def _get_param_string(params: list[dict[str, Any]], name: str) -> str | None:
     return None
 
 
+@lru_cache(maxsize=128)
+def _timestamp_to_utc_iso(timestamp: float) -> str:
+    """Format a Unix timestamp as an ISO 8601 UTC string.
+
+    Schedules rarely change between polls, so the same timestamps recur on every update.
+    """
+    return datetime.fromtimestamp(timestamp, tz=UTC).isoformat()
+
+
 def _transform_schedule_entries(
     schedule: list[dict[str, Any]] | None,
 ) -> list[dict[str, Any]] | None:
@@ -211,10 +224,10 @@ def _transform_schedule_entries(
         # Add UTC timestamps
         from_ts = entry.get("from")
         if from_ts is not None:
-            transformed["from_utc"] = datetime.fromtimestamp(from_ts, tz=UTC).isoformat()
+            transformed["from_utc"] = _timestamp_to_utc_iso(from_ts)
         to_ts = entry.get("to")
         if to_ts is not None:
-            transformed["to_utc"] = datetime.fromtimestamp(to_ts, tz=UTC).isoformat()
+            transformed["to_utc"] = _timestamp_to_utc_iso(to_ts)
         result.append(transformed)
     return result
 
@@ -718,6 +731,12 @@ ALL_SENSORS = (
     + EXTERNAL_SENSOR_SENSORS
 )
 
+# Read-only key index over ALL_SENSORS; cluster-only sensors are excluded because
+# rated_power is defined for both the ECU and the cluster device.
+ALL_SENSORS_BY_KEY: Mapping[str, HomevoltSensorEntityDescription] = MappingProxyType(
+    {description.key: description for description in ALL_SENSORS}
+)
+
 
 def _has_external_sensor(coordinator: HomevoltCoordinator, sensor_type: str) -> bool:
     """Check if an external sensor type is present in the device data."""
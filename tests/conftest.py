@@ -1,13 +1,52 @@
 """Fixtures for Homevolt Local tests."""
 
-from collections.abc import Generator
+from collections.abc import Generator, Mapping
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
 
+from custom_components.homevolt_local.number import NUMBERS, HomevoltNumberEntityDescription
+from custom_components.homevolt_local.select import SELECTS, HomevoltSelectEntityDescription
+from custom_components.homevolt_local.sensor import (
+    ALL_SENSORS_BY_KEY,
+    HomevoltSensorEntityDescription,
+)
+
 pytest_plugins = "pytest_homeassistant_custom_component"
 
+_MOCK_CONFIG_DATA = {
+    CONF_HOST: "homevolt-test.local",
+    CONF_USERNAME: "admin",
+    CONF_PASSWORD: "testpass",
+}
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add command line options."""
+    parser.addoption(
+        "--fast",
+        action="store_true",
+        default=False,
+        help="Skip tests marked @pytest.mark.integration; other hass-based tests still run",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register custom markers."""
+    config.addinivalue_line("markers", "integration: slow tests skipped by --fast")
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip integration tests when --fast is passed."""
+    if not config.getoption("--fast"):
+        return
+    skip_integration = pytest.mark.skip(reason="skipped by --fast")
+    for item in items:
+        if item.get_closest_marker("integration"):
+            item.add_marker(skip_integration)
+
 
 @pytest.fixture(autouse=True)
 def auto_enable_custom_integrations(enable_custom_integrations):
@@ -44,13 +83,9 @@ def mock_homevolt_api() -> Generator[AsyncMock]:
 
 
 @pytest.fixture
-def mock_config_data() -> dict:
-    """Return mock config data."""
-    return {
-        CONF_HOST: "homevolt-test.local",
-        CONF_USERNAME: "admin",
-        CONF_PASSWORD: "testpass",
-    }
+def mock_config_data() -> MappingProxyType[str, str]:
+    """Return mock config data as a read-only view."""
+    return MappingProxyType(_MOCK_CONFIG_DATA)
 
 
 @pytest.fixture
@@ -61,9 +96,12 @@ def mock_config_data_no_auth() -> dict:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_ems_data() -> dict:
-    """Return mock EMS data in nested format (leader - has multiple units)."""
+    """Return mock EMS data in nested format (leader - has multiple units).
+
+    Session-scoped like the other read-only payload fixtures; tests must not mutate it.
+    """
     return {
         "ems": [
             {
@@ -149,7 +187,49 @@ def mock_ems_data() -> dict:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def aggregated_view(mock_ems_data: dict) -> dict:
+    """Return mock EMS data reduced to what cluster sensors read: ems=[aggregated] and sensors."""
+    return {"ems": [mock_ems_data["aggregated"]], "sensors": mock_ems_data.get("sensors", [])}
+
+
+@pytest.fixture(scope="session")
+def mock_ems_with_sensors() -> dict:
+    """Return mock EMS data with sensors array at top level."""
+    return {
+        "sensors": [
+            {
+                "type": "grid",
+                "total_power": 1500,
+                "energy_imported": 100.5,
+                "energy_exported": 50.25,
+                "rssi": -45,
+                "pdr": 95,
+                "available": True,
+            },
+            {
+                "type": "solar",
+                "total_power": 2000,
+                "energy_imported": 500.75,
+                "energy_exported": 0.0,
+                "rssi": -50,
+                "pdr": 98,
+                "available": True,
+            },
+            {
+                "type": "load",
+                "total_power": 800,
+                "energy_imported": 200.0,
+                "energy_exported": 10.0,
+                "rssi": -55,
+                "pdr": 90,
+                "available": True,
+            },
+        ]
+    }
+
+
+@pytest.fixture(scope="session")
 def mock_mains_data() -> dict:
     """Return mock mains data."""
     return {
@@ -158,7 +238,7 @@ def mock_mains_data() -> dict:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_status_data() -> dict:
     """Return mock status data."""
     return {
@@ -288,7 +368,7 @@ def mock_nodes_data() -> dict:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_schedule_data() -> dict:
     """Return mock schedule data."""
     return {
@@ -335,3 +415,39 @@ def mock_coordinator_data(
         "nodes": {},
         "schedule": mock_schedule_data,
     }
+
+
+@pytest.fixture
+def entity_coordinator() -> SimpleNamespace:
+    """Return a fake coordinator exposing the attributes entity platforms read."""
+    return SimpleNamespace(
+        device_id="test123",
+        device_name="Test Homevolt",
+        firmware_version="1.0.0",
+    )
+
+
+@pytest.fixture
+def api_coordinator(entity_coordinator: SimpleNamespace) -> SimpleNamespace:
+    """Return a fake coordinator with an API that accepts param writes."""
+    entity_coordinator.api = SimpleNamespace(set_param=AsyncMock())
+    entity_coordinator.async_request_refresh = AsyncMock()
+    return entity_coordinator
+
+
+@pytest.fixture(scope="session")
+def numbers_by_key() -> dict[str, HomevoltNumberEntityDescription]:
+    """Return number entity descriptions keyed by entity key."""
+    return {number.key: number for number in NUMBERS}
+
+
+@pytest.fixture(scope="session")
+def selects_by_key() -> dict[str, HomevoltSelectEntityDescription]:
+    """Return select entity descriptions keyed by entity key."""
+    return {select.key: select for select in SELECTS}
+
+
+@pytest.fixture(scope="session")
+def sensors_by_key() -> Mapping[str, HomevoltSensorEntityDescription]:
+    """Return sensor entity descriptions keyed by entity key (excludes cluster-only sensors)."""
+    return ALL_SENSORS_BY_KEY
@@ -15,6 +15,14 @@ from custom_components.homevolt_local.coordinator import (
 )
 
 
+@pytest.fixture
+def mock_api() -> MagicMock:
+    """Create a mock API client."""
+    api = MagicMock()
+    api.get_all_data = AsyncMock(return_value={})
+    return api
+
+
 class TestExtractDeviceIdFromHost:
     """Test _extract_device_id_from_host function."""
 
@@ -98,13 +106,6 @@ class TestExtractEcuId:
 class TestHomevoltCoordinator:
     """Test HomevoltCoordinator class."""
 
-    @pytest.fixture
-    def mock_api(self) -> MagicMock:
-        """Create a mock API client."""
-        api = MagicMock()
-        api.get_all_data = AsyncMock(return_value={})
-        return api
-
     @pytest.fixture
     def coordinator(self, hass: HomeAssistant, mock_api: MagicMock) -> HomevoltCoordinator:
         """Create a coordinator for testing."""
@@ -214,13 +215,6 @@ class TestHomevoltCoordinator:
 class TestLeaderDetection:
     """Test is_leader property."""
 
-    @pytest.fixture
-    def mock_api(self) -> MagicMock:
-        """Create a mock API client."""
-        api = MagicMock()
-        api.get_all_data = AsyncMock(return_value={})
-        return api
-
     @pytest.fixture
     def coordinator(self, hass: HomeAssistant, mock_api: MagicMock) -> HomevoltCoordinator:
         """Create a coordinator for testing."""
@@ -371,13 +365,6 @@ class TestLeaderDetection:
 class TestClusterProperties:
     """Test cluster_id and cluster_name properties."""
 
-    @pytest.fixture
-    def mock_api(self) -> MagicMock:
-        """Create a mock API client."""
-        api = MagicMock()
-        api.get_all_data = AsyncMock(return_value={})
-        return api
-
     async def test_cluster_id(self, hass: HomeAssistant, mock_api: MagicMock) -> None:
         """Test cluster_id returns correct format."""
         coordinator = HomevoltCoordinator(
@@ -1,5 +1,6 @@
 """Tests for Homevolt Local device helpers."""
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -12,6 +13,9 @@ from custom_components.homevolt_local.device import (
     get_cluster_device_info,
     get_ecu_device_info,
 )
+from custom_components.homevolt_local.number import NUMBERS, HomevoltNumber
+from custom_components.homevolt_local.select import SELECTS, HomevoltSelect
+from custom_components.homevolt_local.switch import SWITCHES, HomevoltSwitch
 
 
 class TestDeviceType:
@@ -99,3 +103,26 @@ class TestDeviceInfoHelpers:
         # via_device should point to the ECU device identifier
         ecu_identifier = list(ecu_info["identifiers"])[0]
         assert cluster_info["via_device"] == ecu_identifier
+
+
+class TestEntityDeviceInfo:
+    """Test device_info shared by ECU-attached entity platforms."""
+
+    @pytest.mark.parametrize(
+        ("entity_cls", "description"),
+        [(HomevoltNumber, NUMBERS[0]), (HomevoltSelect, SELECTS[0]), (HomevoltSwitch, SWITCHES[0])],
+        ids=["number", "select", "switch"],
+    )
+    def test_entity_device_info(
+        self, entity_coordinator: SimpleNamespace, entity_cls: type, description: object
+    ) -> None:
+        """Test entity device_info points at the ECU device."""
+        entity = entity_cls(entity_coordinator, description)
+
+        device_info = entity.device_info
+        assert device_info is not None
+        assert (DOMAIN, "test123") in device_info["identifiers"]
+        assert device_info["name"] == "Test Homevolt"
+        assert device_info["manufacturer"] == MANUFACTURER
+        assert device_info["model"] == MODEL
+        assert device_info["sw_version"] == "1.0.0"
@@ -1,15 +1,19 @@
 """Tests for Homevolt Local integration setup."""
 
-from unittest.mock import AsyncMock, patch
+from collections.abc import Generator
+from types import MappingProxyType
+from unittest.mock import DEFAULT, MagicMock, patch
 
 import pytest
 import voluptuous as vol
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.homevolt_local import (
     SCHEDULE_ENTRY_SCHEMA,
     SERVICE_SET_SCHEDULE_SCHEMA,
+    async_setup_entry,
     validate_iso8601_datetime,
 )
 from custom_components.homevolt_local.api import (
@@ -19,6 +23,69 @@ from custom_components.homevolt_local.api import (
 )
 from custom_components.homevolt_local.const import DOMAIN
 
+# The schema builds new dicts and never mutates its input, so every slot can
+# share a single entry
+_ENTRY = {"type": 1}
+_ENTRIES_100 = [_ENTRY] * 100
+_ENTRIES_101 = [_ENTRY] * 101
+
+# Entry with every optional field set to a boundary value
+_ALL_FIELDS_ENTRY = {
+    "type": 9,
+    "from_time": "2024-01-15T00:00:00",
+    "to_time": "2024-01-15T23:59:59",
+    "min_soc": 0,
+    "max_soc": 100,
+    "setpoint": -25000,
+    "max_charge": 25000,
+    "max_discharge": 25000,
+    "import_limit": -25000,
+    "export_limit": 25000,
+}
+
+# (field, value, direction) just outside each power field's allowed range
+_OUT_OF_RANGE_CASES = [
+    ("setpoint", -25001, "below"),
+    ("setpoint", 25001, "above"),
+    ("max_charge", -1, "below"),
+    ("max_charge", 25001, "above"),
+    ("max_discharge", -1, "below"),
+    ("max_discharge", 25001, "above"),
+    ("import_limit", -25001, "below"),
+    ("import_limit", 25001, "above"),
+    ("export_limit", -25001, "below"),
+    ("export_limit", 25001, "above"),
+]
+
+
+@pytest.fixture
+def error_entry(
+    hass: HomeAssistant, mock_config_data: MappingProxyType[str, str]
+) -> MockConfigEntry:
+    """Return a config entry already added to hass."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=mock_config_data,
+        unique_id="test123",
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+@pytest.fixture
+def mock_api_cls() -> Generator[MagicMock]:
+    """Patch HomevoltApi and HomevoltCoordinator in the integration setup.
+
+    The coordinator is stubbed too so a failure that slips past
+    test_connection never builds a real one.
+    """
+    with patch.multiple(
+        "custom_components.homevolt_local",
+        HomevoltApi=DEFAULT,
+        HomevoltCoordinator=DEFAULT,
+    ) as mocks:
+        yield mocks["HomevoltApi"]
+
 
 class TestValidateIso8601Datetime:
     """Tests for ISO 8601 datetime validation."""
@@ -31,9 +98,8 @@ class TestValidateIso8601Datetime:
 
     def test_invalid_format_space(self) -> None:
         """Test datetime with space instead of T is rejected."""
-        with pytest.raises(vol.Invalid) as exc_info:
+        with pytest.raises(vol.Invalid, match="Invalid datetime format"):
             validate_iso8601_datetime("2024-01-15 23:00:00")
-        assert "Invalid datetime format" in str(exc_info.value)
 
     def test_invalid_format_missing_seconds(self) -> None:
         """Test datetime without seconds is rejected."""
@@ -45,26 +111,29 @@ class TestValidateIso8601Datetime:
         with pytest.raises(vol.Invalid):
             validate_iso8601_datetime("2024-01-15T23:00:00Z")
 
-    def test_command_injection_attempt(self) -> None:
-        """Test command injection attempt is rejected."""
-        with pytest.raises(vol.Invalid):
-            validate_iso8601_datetime("2024-01-15T23:00:00; rm -rf /")
-
-    def test_command_injection_pipe(self) -> None:
-        """Test pipe injection attempt is rejected."""
+    def test_invalid_format_trailing_newline(self) -> None:
+        """Test datetime with trailing newline is rejected."""
         with pytest.raises(vol.Invalid):
-            validate_iso8601_datetime("2024-01-15T23:00:00 | cat /etc/passwd")
+            validate_iso8601_datetime("2024-01-15T23:00:00\n")
 
-    def test_command_injection_backtick(self) -> None:
-        """Test backtick injection attempt is rejected."""
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "2024-01-15T23:00:00; rm -rf /",
+            "2024-01-15T23:00:00 | cat /etc/passwd",
+            "2024-01-15T23:00:00`whoami`",
+        ],
+        ids=["semicolon", "pipe", "backtick"],
+    )
+    def test_command_injection(self, value: str) -> None:
+        """Test command injection attempts are rejected."""
         with pytest.raises(vol.Invalid):
-            validate_iso8601_datetime("2024-01-15T23:00:00`whoami`")
+            validate_iso8601_datetime(value)
 
     def test_non_string_input(self) -> None:
         """Test non-string input is rejected."""
-        with pytest.raises(vol.Invalid) as exc_info:
+        with pytest.raises(vol.Invalid, match="Expected string"):
             validate_iso8601_datetime(12345)  # type: ignore[arg-type]
-        assert "Expected string" in str(exc_info.value)
 
 
 class TestScheduleEntrySchema:
@@ -77,71 +146,19 @@ class TestScheduleEntrySchema:
 
     def test_valid_entry_all_fields(self) -> None:
         """Test valid entry with all fields at boundary values."""
-        entry = {
-            "type": 9,
-            "from_time": "2024-01-15T00:00:00",
-            "to_time": "2024-01-15T23:59:59",
-            "min_soc": 0,
-            "max_soc": 100,
-            "setpoint": -25000,
-            "max_charge": 25000,
-            "max_discharge": 25000,
-            "import_limit": -25000,
-            "export_limit": 25000,
-        }
-        result = SCHEDULE_ENTRY_SCHEMA(entry)
+        result = SCHEDULE_ENTRY_SCHEMA(_ALL_FIELDS_ENTRY)
         assert result["setpoint"] == -25000
         assert result["max_charge"] == 25000
 
-    def test_setpoint_rejects_below_min(self) -> None:
-        """Test setpoint rejects values below -25000."""
-        with pytest.raises(vol.Invalid):
-            SCHEDULE_ENTRY_SCHEMA({"type": 1, "setpoint": -25001})
-
-    def test_setpoint_rejects_above_max(self) -> None:
-        """Test setpoint rejects values above 25000."""
-        with pytest.raises(vol.Invalid):
-            SCHEDULE_ENTRY_SCHEMA({"type": 1, "setpoint": 25001})
-
-    def test_max_charge_rejects_negative(self) -> None:
-        """Test max_charge rejects negative values."""
-        with pytest.raises(vol.Invalid):
-            SCHEDULE_ENTRY_SCHEMA({"type": 1, "max_charge": -1})
-
-    def test_max_charge_rejects_above_max(self) -> None:
-        """Test max_charge rejects values above 25000."""
-        with pytest.raises(vol.Invalid):
-            SCHEDULE_ENTRY_SCHEMA({"type": 1, "max_charge": 25001})
-
-    def test_max_discharge_rejects_negative(self) -> None:
-        """Test max_discharge rejects negative values."""
-        with pytest.raises(vol.Invalid):
-            SCHEDULE_ENTRY_SCHEMA({"type": 1, "max_discharge": -1})
-
-    def test_max_discharge_rejects_above_max(self) -> None:
-        """Test max_discharge rejects values above 25000."""
-        with pytest.raises(vol.Invalid):
-            SCHEDULE_ENTRY_SCHEMA({"type": 1, "max_discharge": 25001})
-
-    def test_import_limit_rejects_below_min(self) -> None:
-        """Test import_limit rejects values below -25000."""
-        with pytest.raises(vol.Invalid):
-            SCHEDULE_ENTRY_SCHEMA({"type": 1, "import_limit": -25001})
-
-    def test_import_limit_rejects_above_max(self) -> None:
-        """Test import_limit rejects values above 25000."""
-        with pytest.raises(vol.Invalid):
-            SCHEDULE_ENTRY_SCHEMA({"type": 1, "import_limit": 25001})
-
-    def test_export_limit_rejects_below_min(self) -> None:
-        """Test export_limit rejects values below -25000."""
-        with pytest.raises(vol.Invalid):
-            SCHEDULE_ENTRY_SCHEMA({"type": 1, "export_limit": -25001})
-
-    def test_export_limit_rejects_above_max(self) -> None:
-        """Test export_limit rejects values above 25000."""
+    @pytest.mark.parametrize(
+        ("field", "value"),
+        [(field, value) for field, value, _ in _OUT_OF_RANGE_CASES],
+        ids=[f"{field}-{direction}" for field, _, direction in _OUT_OF_RANGE_CASES],
+    )
+    def test_field_rejects_out_of_range(self, field: str, value: int) -> None:
+        """Test power fields reject values outside their allowed range."""
         with pytest.raises(vol.Invalid):
-            SCHEDULE_ENTRY_SCHEMA({"type": 1, "export_limit": 25001})
+            SCHEDULE_ENTRY_SCHEMA({"type": 1, field: value})
 
 
 class TestServiceSetScheduleSchema:
@@ -170,105 +187,47 @@ class TestServiceSetScheduleSchema:
 
     def test_rejects_schedule_over_100_entries(self) -> None:
         """Test schema rejects schedule with more than 100 entries."""
-        entries = [{"type": 1} for _ in range(101)]
         with pytest.raises(vol.Invalid):
             SERVICE_SET_SCHEDULE_SCHEMA(
                 {
                     "device_id": "test_device",
-                    "schedule": entries,
+                    "schedule": _ENTRIES_101,
                 }
             )
 
     def test_accepts_schedule_with_100_entries(self) -> None:
         """Test schema accepts schedule with exactly 100 entries."""
-        entries = [{"type": 1} for _ in range(100)]
         result = SERVICE_SET_SCHEDULE_SCHEMA(
             {
                 "device_id": "test_device",
-                "schedule": entries,
+                "schedule": _ENTRIES_100,
             }
         )
         assert len(result["schedule"]) == 100
 
 
-async def test_setup_entry_auth_error(
-    hass: HomeAssistant,
-    mock_config_data: dict,
-) -> None:
-    """Test setup fails with auth error."""
-    from pytest_homeassistant_custom_component.common import MockConfigEntry
-
-    from custom_components.homevolt_local import async_setup_entry
-
-    entry = MockConfigEntry(
-        domain=DOMAIN,
-        data=mock_config_data,
-        unique_id="test123",
-    )
-    entry.add_to_hass(hass)
-
-    with patch(
-        "custom_components.homevolt_local.HomevoltApi",
-        autospec=True,
-    ) as mock_api_class:
-        mock_api = mock_api_class.return_value
-        mock_api.test_connection = AsyncMock(side_effect=HomevoltAuthError("Invalid credentials"))
-
-        with pytest.raises(ConfigEntryAuthFailed):
-            await async_setup_entry(hass, entry)
-
-
-async def test_setup_entry_rate_limit_error(
-    hass: HomeAssistant,
-    mock_config_data: dict,
-) -> None:
-    """Test setup fails with rate limit error."""
-    from pytest_homeassistant_custom_component.common import MockConfigEntry
-
-    from custom_components.homevolt_local import async_setup_entry
-
-    entry = MockConfigEntry(
-        domain=DOMAIN,
-        data=mock_config_data,
-        unique_id="test123",
-    )
-    entry.add_to_hass(hass)
-
-    with patch(
-        "custom_components.homevolt_local.HomevoltApi",
-        autospec=True,
-    ) as mock_api_class:
-        mock_api = mock_api_class.return_value
-        mock_api.test_connection = AsyncMock(side_effect=HomevoltRateLimitError("Rate limited"))
-
-        with pytest.raises(ConfigEntryNotReady):
-            await async_setup_entry(hass, entry)
-
-
-async def test_setup_entry_connection_error(
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    ("exception", "expected"),
+    [
+        (HomevoltAuthError("Invalid credentials"), ConfigEntryAuthFailed),
+        (HomevoltRateLimitError("Rate limited"), ConfigEntryNotReady),
+        (HomevoltConnectionError("Connection failed"), ConfigEntryNotReady),
+    ],
+)
+async def test_setup_entry_errors(
     hass: HomeAssistant,
-    mock_config_data: dict,
+    error_entry: MockConfigEntry,
+    mock_api_cls: MagicMock,
+    exception: Exception,
+    expected: type[Exception],
 ) -> None:
-    """Test setup fails with connection error."""
-    from pytest_homeassistant_custom_component.common import MockConfigEntry
+    """Test setup maps API errors to the matching config entry exception."""
 
-    from custom_components.homevolt_local import async_setup_entry
+    async def _raise(*args: object, **kwargs: object) -> None:
+        raise exception
 
-    entry = MockConfigEntry(
-        domain=DOMAIN,
-        data=mock_config_data,
-        unique_id="test123",
-    )
-    entry.add_to_hass(hass)
-
-    with patch(
-        "custom_components.homevolt_local.HomevoltApi",
-        autospec=True,
-    ) as mock_api_class:
-        mock_api = mock_api_class.return_value
-        mock_api.test_connection = AsyncMock(
-            side_effect=HomevoltConnectionError("Connection failed")
-        )
+    mock_api_cls.return_value.test_connection = _raise
 
-        with pytest.raises(ConfigEntryNotReady):
-            await async_setup_entry(hass, entry)
+    with pytest.raises(expected):
+        await async_setup_entry(hass, error_entry)
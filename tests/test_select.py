@@ -1,6 +1,7 @@
 """Tests for Homevolt Local select platform."""
 
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+from typing import Any
 
 import pytest
 from homeassistant.const import EntityCategory
@@ -9,49 +10,40 @@ from custom_components.homevolt_local.select import (
     PARALLEL_UPDATES,
     SELECTS,
     HomevoltSelect,
+    HomevoltSelectEntityDescription,
     _get_param_string,
 )
 
+assert PARALLEL_UPDATES == 1, "select.PARALLEL_UPDATES must be 1"
+
 
 class TestGetParamString:
     """Test _get_param_string helper function."""
 
-    def test_param_string_direct_value(self) -> None:
-        """Test extraction when value is a direct string."""
-        params = [{"name": "ledstrip_mode", "value": "soc"}]
-        assert _get_param_string(params, "ledstrip_mode") == "soc"
-
-    def test_param_string_array_value(self) -> None:
-        """Test extraction when value is in array format."""
-        params = [{"name": "ledstrip_mode", "value": ["on"]}]
-        assert _get_param_string(params, "ledstrip_mode") == "on"
-
-    def test_param_string_not_found(self) -> None:
-        """Test extraction when param not in list."""
-        params = [{"name": "other_param", "value": "test"}]
-        assert _get_param_string(params, "ledstrip_mode") is None
-
-    def test_param_string_empty_list(self) -> None:
-        """Test extraction with empty params list."""
-        params = []
-        assert _get_param_string(params, "ledstrip_mode") is None
-
-    def test_param_string_not_list(self) -> None:
-        """Test extraction when params is not a list."""
-        params = {"name": "ledstrip_mode", "value": "soc"}
-        assert _get_param_string(params, "ledstrip_mode") is None
+    @pytest.mark.parametrize(
+        ("params", "key", "expected"),
+        [
+            ([{"name": "ledstrip_mode", "value": "soc"}], "ledstrip_mode", "soc"),
+            ([{"name": "ledstrip_mode", "value": ["on"]}], "ledstrip_mode", "on"),
+            ([{"name": "other_param", "value": "test"}], "ledstrip_mode", None),
+            ([], "ledstrip_mode", None),
+            ({"name": "ledstrip_mode", "value": "soc"}, "ledstrip_mode", None),
+        ],
+        ids=["direct_value", "array_value", "not_found", "empty_list", "not_list"],
+    )
+    def test_get_param_string(self, params: Any, key: str, expected: str | None) -> None:
+        """Test extraction of string param values."""
+        assert _get_param_string(params, key) == expected
 
 
 class TestSelectDescriptions:
     """Test select entity descriptions."""
 
-    def test_parallel_updates_constant(self) -> None:
-        """Test PARALLEL_UPDATES is set to 1."""
-        assert PARALLEL_UPDATES == 1
-
-    def test_ledstrip_mode_select_description(self) -> None:
+    def test_ledstrip_mode_select_description(
+        self, selects_by_key: dict[str, HomevoltSelectEntityDescription]
+    ) -> None:
         """Test ledstrip_mode select description."""
-        select = next(s for s in SELECTS if s.key == "ledstrip_mode")
+        select = selects_by_key["ledstrip_mode"]
         assert select.translation_key == "ledstrip_mode"
         assert select.param_key == "ledstrip_mode"
         assert select.options == ["unset", "off", "on", "soc", "dem", "ser"]
@@ -59,127 +51,65 @@ class TestSelectDescriptions:
 
     def test_all_selects_have_translation_key(self) -> None:
         """Test all selects have translation_key set."""
-        for select in SELECTS:
-            assert select.translation_key is not None
-            assert select.translation_key == select.key
+        assert all(
+            select.translation_key is not None and select.translation_key == select.key
+            for select in SELECTS
+        )
+
+
+@pytest.fixture
+def select(
+    entity_coordinator: SimpleNamespace, selects_by_key: dict[str, HomevoltSelectEntityDescription]
+) -> HomevoltSelect:
+    """Return the ledstrip_mode select bound to the shared fake coordinator."""
+    return HomevoltSelect(entity_coordinator, selects_by_key["ledstrip_mode"])
 
 
 class TestHomevoltSelect:
     """Test HomevoltSelect entity."""
 
-    def test_select_current_option(self) -> None:
+    def test_select_current_option(
+        self, entity_coordinator: SimpleNamespace, select: HomevoltSelect
+    ) -> None:
         """Test select current_option returns correct value."""
-        coordinator = MagicMock()
-        coordinator.device_id = "test123"
-        coordinator.device_name = "Test Homevolt"
-        coordinator.firmware_version = "1.0.0"
-        coordinator.data = {"params": [{"name": "ledstrip_mode", "value": "soc"}]}
-
-        description = SELECTS[0]
-        select = HomevoltSelect(coordinator, description)
-
+        entity_coordinator.data = {"params": [{"name": "ledstrip_mode", "value": "soc"}]}
         assert select.current_option == "soc"
 
-    def test_select_current_option_unset_when_empty(self) -> None:
+    def test_select_current_option_unset_when_empty(
+        self, entity_coordinator: SimpleNamespace, select: HomevoltSelect
+    ) -> None:
         """Test select current_option returns 'unset' for empty string."""
-        coordinator = MagicMock()
-        coordinator.device_id = "test123"
-        coordinator.device_name = "Test Homevolt"
-        coordinator.firmware_version = "1.0.0"
-        coordinator.data = {"params": [{"name": "ledstrip_mode", "value": ""}]}
-
-        description = SELECTS[0]
-        select = HomevoltSelect(coordinator, description)
-
+        entity_coordinator.data = {"params": [{"name": "ledstrip_mode", "value": ""}]}
         assert select.current_option == "unset"
 
-    def test_select_current_option_unset_when_missing(self) -> None:
+    def test_select_current_option_unset_when_missing(
+        self, entity_coordinator: SimpleNamespace, select: HomevoltSelect
+    ) -> None:
         """Test select current_option returns 'unset' when param not found."""
-        coordinator = MagicMock()
-        coordinator.device_id = "test123"
-        coordinator.device_name = "Test Homevolt"
-        coordinator.firmware_version = "1.0.0"
-        coordinator.data = {"params": []}
-
-        description = SELECTS[0]
-        select = HomevoltSelect(coordinator, description)
-
+        entity_coordinator.data = {"params": []}
         assert select.current_option == "unset"
 
-    def test_select_current_option_none_when_invalid(self) -> None:
+    def test_select_current_option_none_when_invalid(
+        self, entity_coordinator: SimpleNamespace, select: HomevoltSelect
+    ) -> None:
         """Test select current_option returns None for invalid option."""
-        coordinator = MagicMock()
-        coordinator.device_id = "test123"
-        coordinator.device_name = "Test Homevolt"
-        coordinator.firmware_version = "1.0.0"
-        coordinator.data = {"params": [{"name": "ledstrip_mode", "value": "invalid"}]}
-
-        description = SELECTS[0]
-        select = HomevoltSelect(coordinator, description)
-
+        entity_coordinator.data = {"params": [{"name": "ledstrip_mode", "value": "invalid"}]}
         assert select.current_option is None
 
-    def test_select_unique_id(self) -> None:
+    def test_select_unique_id(self, select: HomevoltSelect) -> None:
         """Test select unique_id is correctly set."""
-        coordinator = MagicMock()
-        coordinator.device_id = "test123"
-        coordinator.device_name = "Test Homevolt"
-        coordinator.firmware_version = "1.0.0"
-        coordinator.data = {"params": []}
-
-        description = SELECTS[0]
-        select = HomevoltSelect(coordinator, description)
-
         assert select.unique_id == "test123_ledstrip_mode"
 
-    def test_select_has_entity_name(self) -> None:
+    def test_select_has_entity_name(self, select: HomevoltSelect) -> None:
         """Test select has _attr_has_entity_name set."""
-        coordinator = MagicMock()
-        coordinator.device_id = "test123"
-        coordinator.device_name = "Test Homevolt"
-        coordinator.firmware_version = "1.0.0"
-        coordinator.data = {"params": []}
-
-        description = SELECTS[0]
-        select = HomevoltSelect(coordinator, description)
-
         assert select._attr_has_entity_name is True
 
     @pytest.mark.asyncio
-    async def test_async_select_option(self) -> None:
+    async def test_async_select_option(
+        self, api_coordinator: SimpleNamespace, select: HomevoltSelect
+    ) -> None:
         """Test async_select_option calls API and refreshes coordinator."""
-        coordinator = MagicMock()
-        coordinator.device_id = "test123"
-        coordinator.device_name = "Test Homevolt"
-        coordinator.firmware_version = "1.0.0"
-        coordinator.data = {"params": []}
-        coordinator.api = MagicMock()
-        coordinator.api.set_param = AsyncMock()
-        coordinator.async_request_refresh = AsyncMock()
-
-        description = SELECTS[0]
-        select = HomevoltSelect(coordinator, description)
-
         await select.async_select_option("on")
 
-        coordinator.api.set_param.assert_called_once_with("ledstrip_mode", "on")
-        coordinator.async_request_refresh.assert_called_once()
-
-    def test_select_device_info(self) -> None:
-        """Test select device_info is correctly set."""
-        coordinator = MagicMock()
-        coordinator.device_id = "test123"
-        coordinator.device_name = "Test Homevolt"
-        coordinator.firmware_version = "1.0.0"
-        coordinator.data = {"params": []}
-
-        description = SELECTS[0]
-        select = HomevoltSelect(coordinator, description)
-
-        device_info = select.device_info
-        assert device_info is not None
-        assert ("homevolt_local", "test123") in device_info["identifiers"]
-        assert device_info["name"] == "Test Homevolt"
-        assert device_info["manufacturer"] == "Tibber"
-        assert device_info["model"] == "Homevolt Battery"
-        assert device_info["sw_version"] == "1.0.0"
+        api_coordinator.api.set_param.assert_called_once_with("ledstrip_mode", "on")
+        api_coordinator.async_request_refresh.assert_called_once()
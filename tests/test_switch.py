@@ -1,6 +1,7 @@
 """Tests for Homevolt Local switch platform."""
 
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+from typing import Any
 
 import pytest
 from homeassistant.const import EntityCategory
@@ -9,6 +10,7 @@ from custom_components.homevolt_local.switch import (
     PARALLEL_UPDATES,
     SWITCHES,
     HomevoltSwitch,
+    HomevoltSwitchEntityDescription,
     _get_param_bool,
 )
 
@@ -16,79 +18,55 @@ from custom_components.homevolt_local.switch import (
 class TestGetParamBool:
     """Test _get_param_bool helper function."""
 
-    def test_param_bool_true_bool(self) -> None:
-        """Test extraction when value is True boolean."""
-        params = [{"name": "settings_local", "value": True}]
-        assert _get_param_bool(params, "settings_local") is True
-
-    def test_param_bool_false_bool(self) -> None:
-        """Test extraction when value is False boolean."""
-        params = [{"name": "settings_local", "value": False}]
-        assert _get_param_bool(params, "settings_local") is False
-
-    def test_param_bool_true_string(self) -> None:
-        """Test extraction when value is 'true' string."""
-        params = [{"name": "settings_local", "value": "true"}]
-        assert _get_param_bool(params, "settings_local") is True
-
-    def test_param_bool_false_string(self) -> None:
-        """Test extraction when value is 'false' string."""
-        params = [{"name": "settings_local", "value": "false"}]
-        assert _get_param_bool(params, "settings_local") is False
-
-    def test_param_bool_one_int(self) -> None:
-        """Test extraction when value is 1 integer."""
-        params = [{"name": "settings_local", "value": 1}]
-        assert _get_param_bool(params, "settings_local") is True
-
-    def test_param_bool_zero_int(self) -> None:
-        """Test extraction when value is 0 integer."""
-        params = [{"name": "settings_local", "value": 0}]
-        assert _get_param_bool(params, "settings_local") is False
-
-    def test_param_bool_one_string(self) -> None:
-        """Test extraction when value is '1' string."""
-        params = [{"name": "settings_local", "value": "1"}]
-        assert _get_param_bool(params, "settings_local") is True
-
-    def test_param_bool_zero_string(self) -> None:
-        """Test extraction when value is '0' string."""
-        params = [{"name": "settings_local", "value": "0"}]
-        assert _get_param_bool(params, "settings_local") is False
-
-    def test_param_bool_not_found(self) -> None:
-        """Test extraction when param not in list."""
-        params = [{"name": "other_param", "value": "some_value"}]
-        assert _get_param_bool(params, "settings_local") is None
-
-    def test_param_bool_empty_list(self) -> None:
-        """Test extraction with empty params list."""
-        params = []
-        assert _get_param_bool(params, "settings_local") is None
-
-    def test_param_bool_among_other_params(self) -> None:
-        """Test extraction when param is among other params."""
-        params = [
-            {"name": "ecu_mdns_instance_name", "value": "My Homevolt"},
-            {"name": "settings_local", "value": True},
-            {"name": "other_param", "value": "some_value"},
-        ]
-        assert _get_param_bool(params, "settings_local") is True
-
-    def test_param_bool_true_array(self) -> None:
-        """Test extraction when value is [True] array (actual API format)."""
-        params = [{"name": "settings_local", "value": [True]}]
-        assert _get_param_bool(params, "settings_local") is True
-
-    def test_param_bool_false_array(self) -> None:
-        """Test extraction when value is [False] array (actual API format)."""
-        params = [{"name": "settings_local", "value": [False]}]
-        assert _get_param_bool(params, "settings_local") is False
-
-    def test_param_bool_different_param(self) -> None:
-        """Test extraction with different param name."""
-        params = [{"name": "ota_enable_esp32", "value": True}]
-        assert _get_param_bool(params, "ota_enable_esp32") is True
+    @pytest.mark.parametrize(
+        ("params", "key", "expected"),
+        [
+            ([{"name": "settings_local", "value": True}], "settings_local", True),
+            ([{"name": "settings_local", "value": False}], "settings_local", False),
+            ([{"name": "settings_local", "value": "true"}], "settings_local", True),
+            ([{"name": "settings_local", "value": "false"}], "settings_local", False),
+            ([{"name": "settings_local", "value": 1}], "settings_local", True),
+            ([{"name": "settings_local", "value": 0}], "settings_local", False),
+            ([{"name": "settings_local", "value": "1"}], "settings_local", True),
+            ([{"name": "settings_local", "value": "0"}], "settings_local", False),
+            ([{"name": "other_param", "value": "some_value"}], "settings_local", None),
+            ([], "settings_local", None),
+            (
+                [
+                    {"name": "ecu_mdns_instance_name", "value": "My Homevolt"},
+                    {"name": "settings_local", "value": True},
+                    {"name": "other_param", "value": "some_value"},
+                ],
+                "settings_local",
+                True,
+            ),
+            # [bool] arrays are the actual API format
+            ([{"name": "settings_local", "value": [True]}], "settings_local", True),
+            ([{"name": "settings_local", "value": [False]}], "settings_local", False),
+            ([{"name": "ota_enable_esp32", "value": True}], "ota_enable_esp32", True),
+        ],
+        ids=[
+            "true_bool",
+            "false_bool",
+            "true_string",
+            "false_string",
+            "one_int",
+            "zero_int",
+            "one_string",
+            "zero_string",
+            "not_found",
+            "empty_list",
+            "among_other_params",
+            "true_array",
+            "false_array",
+            "different_param",
+        ],
+    )
+    def test_param_bool(
+        self, params: list[dict[str, Any]], key: str, expected: bool | None
+    ) -> None:
+        """Test boolean param extraction across value formats."""
+        assert _get_param_bool(params, key) is expected
 
 
 class TestSwitchDescriptions:
@@ -98,183 +76,86 @@ class TestSwitchDescriptions:
         """Test PARALLEL_UPDATES is set to 1."""
         assert PARALLEL_UPDATES == 1
 
-    def test_settings_local_switch_description(self) -> None:
-        """Test settings_local switch description."""
-        switch = next(s for s in SWITCHES if s.key == "settings_local")
-        assert switch.translation_key == "settings_local"
-        assert switch.param_key == "settings_local"
-
-    def test_ota_enable_switch_description(self) -> None:
-        """Test ota_enable switch description."""
-        switch = next(s for s in SWITCHES if s.key == "ota_enable")
-        assert switch.translation_key == "ota_enable"
-        assert switch.param_key == "ota_enable"
-        assert switch.entity_category == EntityCategory.DIAGNOSTIC
-
-    def test_ota_enable_esp32_switch_description(self) -> None:
-        """Test ota_enable_esp32 switch description."""
-        switch = next(s for s in SWITCHES if s.key == "ota_enable_esp32")
-        assert switch.translation_key == "ota_enable_esp32"
-        assert switch.param_key == "ota_enable_esp32"
-        assert switch.entity_category == EntityCategory.DIAGNOSTIC
+    def test_switch_keys(self) -> None:
+        """Test the expected switches are defined."""
+        assert [switch.key for switch in SWITCHES] == [
+            "settings_local",
+            "ota_enable",
+            "ota_enable_esp32",
+            "ota_enable_hub_web",
+            "ota_enable_bg95_m3",
+        ]
 
-    def test_ota_enable_hub_web_switch_description(self) -> None:
-        """Test ota_enable_hub_web switch description."""
-        switch = next(s for s in SWITCHES if s.key == "ota_enable_hub_web")
-        assert switch.translation_key == "ota_enable_hub_web"
-        assert switch.param_key == "ota_enable_hub_web"
-        assert switch.entity_category == EntityCategory.DIAGNOSTIC
+    @pytest.mark.parametrize("switch", SWITCHES, ids=lambda switch: switch.key)
+    def test_switch_description(self, switch: HomevoltSwitchEntityDescription) -> None:
+        """Test each switch maps to its own param and translation, OTA switches as diagnostic."""
+        assert switch.translation_key == switch.key
+        assert switch.param_key == switch.key
+        expected_category = None if switch.key == "settings_local" else EntityCategory.DIAGNOSTIC
+        assert switch.entity_category is expected_category
 
-    def test_ota_enable_bg95_m3_switch_description(self) -> None:
-        """Test ota_enable_bg95_m3 switch description."""
-        switch = next(s for s in SWITCHES if s.key == "ota_enable_bg95_m3")
-        assert switch.translation_key == "ota_enable_bg95_m3"
-        assert switch.param_key == "ota_enable_bg95_m3"
-        assert switch.entity_category == EntityCategory.DIAGNOSTIC
 
-    def test_all_switches_have_translation_key(self) -> None:
-        """Test all switches have translation_key set."""
-        for switch in SWITCHES:
-            assert switch.translation_key is not None
-            assert switch.translation_key == switch.key
+@pytest.fixture
+def switch(entity_coordinator: SimpleNamespace) -> HomevoltSwitch:
+    """Return the settings_local switch bound to the shared fake coordinator."""
+    return HomevoltSwitch(entity_coordinator, SWITCHES[0])
 
 
 class TestHomevoltSwitch:
     """Test HomevoltSwitch entity."""
 
-    def test_switch_is_on_true(self) -> None:
+    def test_switch_is_on_true(
+        self, entity_coordinator: SimpleNamespace, switch: HomevoltSwitch
+    ) -> None:
         """Test switch is_on returns True when settings_local is true."""
-        coordinator = MagicMock()
-        coordinator.device_id = "test123"
-        coordinator.device_name = "Test Homevolt"
-        coordinator.firmware_version = "1.0.0"
-        coordinator.data = {"params": [{"name": "settings_local", "value": True}]}
-
-        description = SWITCHES[0]
-        switch = HomevoltSwitch(coordinator, description)
-
+        entity_coordinator.data = {"params": [{"name": "settings_local", "value": True}]}
         assert switch.is_on is True
 
-    def test_switch_is_on_false(self) -> None:
+    def test_switch_is_on_false(
+        self, entity_coordinator: SimpleNamespace, switch: HomevoltSwitch
+    ) -> None:
         """Test switch is_on returns False when settings_local is false."""
-        coordinator = MagicMock()
-        coordinator.device_id = "test123"
-        coordinator.device_name = "Test Homevolt"
-        coordinator.firmware_version = "1.0.0"
-        coordinator.data = {"params": [{"name": "settings_local", "value": False}]}
-
-        description = SWITCHES[0]
-        switch = HomevoltSwitch(coordinator, description)
-
+        entity_coordinator.data = {"params": [{"name": "settings_local", "value": False}]}
         assert switch.is_on is False
 
-    def test_switch_is_on_none_when_missing(self) -> None:
+    def test_switch_is_on_none_when_missing(
+        self, entity_coordinator: SimpleNamespace, switch: HomevoltSwitch
+    ) -> None:
         """Test switch is_on returns None when param not found."""
-        coordinator = MagicMock()
-        coordinator.device_id = "test123"
-        coordinator.device_name = "Test Homevolt"
-        coordinator.firmware_version = "1.0.0"
-        coordinator.data = {"params": []}
-
-        description = SWITCHES[0]
-        switch = HomevoltSwitch(coordinator, description)
-
+        entity_coordinator.data = {"params": []}
         assert switch.is_on is None
 
-    def test_switch_is_on_none_when_params_not_list(self) -> None:
+    def test_switch_is_on_none_when_params_not_list(
+        self, entity_coordinator: SimpleNamespace, switch: HomevoltSwitch
+    ) -> None:
         """Test switch is_on returns None when params is not a list."""
-        coordinator = MagicMock()
-        coordinator.device_id = "test123"
-        coordinator.device_name = "Test Homevolt"
-        coordinator.firmware_version = "1.0.0"
-        coordinator.data = {"params": {}}
-
-        description = SWITCHES[0]
-        switch = HomevoltSwitch(coordinator, description)
-
+        entity_coordinator.data = {"params": {}}
         assert switch.is_on is None
 
-    def test_switch_unique_id(self) -> None:
+    def test_switch_unique_id(self, switch: HomevoltSwitch) -> None:
         """Test switch unique_id is correctly set."""
-        coordinator = MagicMock()
-        coordinator.device_id = "test123"
-        coordinator.device_name = "Test Homevolt"
-        coordinator.firmware_version = "1.0.0"
-        coordinator.data = {"params": []}
-
-        description = SWITCHES[0]
-        switch = HomevoltSwitch(coordinator, description)
-
         assert switch.unique_id == "test123_settings_local"
 
-    def test_switch_has_entity_name(self) -> None:
+    def test_switch_has_entity_name(self, switch: HomevoltSwitch) -> None:
         """Test switch has _attr_has_entity_name set."""
-        coordinator = MagicMock()
-        coordinator.device_id = "test123"
-        coordinator.device_name = "Test Homevolt"
-        coordinator.firmware_version = "1.0.0"
-        coordinator.data = {"params": []}
-
-        description = SWITCHES[0]
-        switch = HomevoltSwitch(coordinator, description)
-
         assert switch._attr_has_entity_name is True
 
     @pytest.mark.asyncio
-    async def test_async_turn_on(self) -> None:
+    async def test_async_turn_on(
+        self, api_coordinator: SimpleNamespace, switch: HomevoltSwitch
+    ) -> None:
         """Test async_turn_on calls API and refreshes coordinator."""
-        coordinator = MagicMock()
-        coordinator.device_id = "test123"
-        coordinator.device_name = "Test Homevolt"
-        coordinator.firmware_version = "1.0.0"
-        coordinator.data = {"params": []}
-        coordinator.api = MagicMock()
-        coordinator.api.set_param = AsyncMock()
-        coordinator.async_request_refresh = AsyncMock()
-
-        description = SWITCHES[0]
-        switch = HomevoltSwitch(coordinator, description)
-
         await switch.async_turn_on()
 
-        coordinator.api.set_param.assert_called_once_with("settings_local", "true")
-        coordinator.async_request_refresh.assert_called_once()
+        api_coordinator.api.set_param.assert_called_once_with("settings_local", "true")
+        api_coordinator.async_request_refresh.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_async_turn_off(self) -> None:
+    async def test_async_turn_off(
+        self, api_coordinator: SimpleNamespace, switch: HomevoltSwitch
+    ) -> None:
         """Test async_turn_off calls API and refreshes coordinator."""
-        coordinator = MagicMock()
-        coordinator.device_id = "test123"
-        coordinator.device_name = "Test Homevolt"
-        coordinator.firmware_version = "1.0.0"
-        coordinator.data = {"params": []}
-        coordinator.api = MagicMock()
-        coordinator.api.set_param = AsyncMock()
-        coordinator.async_request_refresh = AsyncMock()
-
-        description = SWITCHES[0]
-        switch = HomevoltSwitch(coordinator, description)
-
         await switch.async_turn_off()
 
-        coordinator.api.set_param.assert_called_once_with("settings_local", "false")
-        coordinator.async_request_refresh.assert_called_once()
-
-    def test_switch_device_info(self) -> None:
-        """Test switch device_info is correctly set."""
-        coordinator = MagicMock()
-        coordinator.device_id = "test123"
-        coordinator.device_name = "Test Homevolt"
-        coordinator.firmware_version = "1.0.0"
-        coordinator.data = {"params": []}
-
-        description = SWITCHES[0]
-        switch = HomevoltSwitch(coordinator, description)
-
-        device_info = switch.device_info
-        assert device_info is not None
-        assert ("homevolt_local", "test123") in device_info["identifiers"]
-        assert device_info["name"] == "Test Homevolt"
-        assert device_info["manufacturer"] == "Tibber"
-        assert device_info["model"] == "Homevolt Battery"
-        assert device_info["sw_version"] == "1.0.0"
+        api_coordinator.api.set_param.assert_called_once_with("settings_local", "false")
+        api_coordinator.async_request_refresh.assert_called_once()
@@ -1,9 +1,13 @@
 """Tests for translation files."""
 
-import json
+import re
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any
 
 import pytest
+from homeassistant.util.json import json_loads
 
 TRANSLATIONS_PATH = (
     Path(__file__).parent.parent / "custom_components" / "homevolt_local" / "translations"
@@ -14,16 +18,62 @@ STRINGS_PATH = (
 
 EXPECTED_LANGUAGES = ["de", "en", "fi", "fr", "nb", "nl", "sv"]
 
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
 
-def get_all_keys(d: dict, prefix: str = "") -> set[str]:
-    """Recursively get all keys from a nested dictionary."""
-    keys = set()
+
+@pytest.fixture(scope="session")
+def translations() -> Mapping[str, dict]:
+    """Return each translation file parsed once, keyed by language code."""
+    return MappingProxyType(
+        {
+            lang: json_loads((TRANSLATIONS_PATH / f"{lang}.json").read_bytes())
+            for lang in EXPECTED_LANGUAGES
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def strings_json() -> dict:
+    """Return strings.json parsed once."""
+    return json_loads(STRINGS_PATH.read_bytes())
+
+
+@pytest.fixture(scope="session")
+def flat_translations(translations: Mapping[str, dict]) -> Mapping[str, Mapping[str, Any]]:
+    """Return each translation flattened to {dotted path: value}, keyed by language code."""
+    return MappingProxyType(
+        {lang: MappingProxyType(flatten(data)) for lang, data in translations.items()}
+    )
+
+
+@pytest.fixture(scope="session")
+def english_placeholders(
+    flat_translations: Mapping[str, Mapping[str, Any]],
+) -> Mapping[str, frozenset[str]]:
+    """Return the placeholders of every English string, keyed by dotted path."""
+    return MappingProxyType(placeholders(flat_translations["en"]))
+
+
+def flatten(d: dict, prefix: str = "", out: dict[str, Any] | None = None) -> dict[str, Any]:
+    """Map every dotted key path in a nested dictionary to its value, nested dicts included."""
+    if out is None:
+        out = {}
     for key, value in d.items():
         full_key = f"{prefix}.{key}" if prefix else key
-        keys.add(full_key)
-        if isinstance(value, dict):
-            keys.update(get_all_keys(value, full_key))
-    return keys
+        out[full_key] = value
+        # JSON parsing only ever yields exact dicts, never subclasses
+        if type(value) is dict:
+            flatten(value, full_key, out)
+    return out
+
+
+def placeholders(flat: Mapping[str, Any]) -> dict[str, frozenset[str]]:
+    """Map the dotted path of every string value to its {placeholder} names."""
+    return {
+        path: frozenset(_PLACEHOLDER_RE.findall(value))
+        for path, value in flat.items()
+        if isinstance(value, str)
+    }
 
 
 class TestTranslationFiles:
@@ -40,28 +90,20 @@ class TestTranslationFiles:
         assert STRINGS_PATH.exists(), "strings.json not found"
 
     @pytest.mark.parametrize("lang", EXPECTED_LANGUAGES)
-    def test_translation_is_valid_json(self, lang: str) -> None:
+    def test_translation_is_valid_json(self, translations: Mapping[str, dict], lang: str) -> None:
         """Test that each translation file is valid JSON."""
-        lang_file = TRANSLATIONS_PATH / f"{lang}.json"
-        with open(lang_file, encoding="utf-8") as f:
-            data = json.load(f)
-        assert isinstance(data, dict)
+        assert isinstance(translations[lang], dict)
 
-    def test_strings_json_is_valid_json(self) -> None:
+    def test_strings_json_is_valid_json(self, strings_json: dict) -> None:
         """Test that strings.json is valid JSON."""
-        with open(STRINGS_PATH, encoding="utf-8") as f:
-            data = json.load(f)
-        assert isinstance(data, dict)
+        assert isinstance(strings_json, dict)
 
-    def test_english_matches_strings_json(self) -> None:
+    def test_english_matches_strings_json(
+        self, flat_translations: Mapping[str, Mapping[str, Any]], strings_json: dict
+    ) -> None:
         """Test that en.json has the same structure as strings.json."""
-        with open(STRINGS_PATH, encoding="utf-8") as f:
-            strings_data = json.load(f)
-        with open(TRANSLATIONS_PATH / "en.json", encoding="utf-8") as f:
-            en_data = json.load(f)
-
-        strings_keys = get_all_keys(strings_data)
-        en_keys = get_all_keys(en_data)
+        strings_keys = flatten(strings_json).keys()
+        en_keys = flat_translations["en"].keys()
 
         assert strings_keys == en_keys, (
             f"Mismatch between strings.json and en.json.\n"
@@ -70,15 +112,12 @@ class TestTranslationFiles:
         )
 
     @pytest.mark.parametrize("lang", EXPECTED_LANGUAGES)
-    def test_translation_has_same_keys_as_english(self, lang: str) -> None:
+    def test_translation_has_same_keys_as_english(
+        self, flat_translations: Mapping[str, Mapping[str, Any]], lang: str
+    ) -> None:
         """Test that each translation has the same keys as English."""
-        with open(TRANSLATIONS_PATH / "en.json", encoding="utf-8") as f:
-            en_data = json.load(f)
-        with open(TRANSLATIONS_PATH / f"{lang}.json", encoding="utf-8") as f:
-            lang_data = json.load(f)
-
-        en_keys = get_all_keys(en_data)
-        lang_keys = get_all_keys(lang_data)
+        en_keys = flat_translations["en"].keys()
+        lang_keys = flat_translations[lang].keys()
 
         assert en_keys == lang_keys, (
             f"Key mismatch in {lang}.json.\n"
@@ -87,58 +126,30 @@ class TestTranslationFiles:
         )
 
     @pytest.mark.parametrize("lang", EXPECTED_LANGUAGES)
-    def test_translation_values_not_empty(self, lang: str) -> None:
+    def test_translation_values_not_empty(
+        self, flat_translations: Mapping[str, Mapping[str, Any]], lang: str
+    ) -> None:
         """Test that translation values are not empty strings."""
-        with open(TRANSLATIONS_PATH / f"{lang}.json", encoding="utf-8") as f:
-            data = json.load(f)
-
-        def check_values(d: dict, path: str = "") -> list[str]:
-            """Check for empty string values."""
-            empty = []
-            for key, value in d.items():
-                current_path = f"{path}.{key}" if path else key
-                if isinstance(value, dict):
-                    empty.extend(check_values(value, current_path))
-                elif isinstance(value, str) and value == "":
-                    empty.append(current_path)
-            return empty
-
-        empty_values = check_values(data)
+        empty_values = [path for path, value in flat_translations[lang].items() if value == ""]
         assert not empty_values, f"Empty values in {lang}.json: {empty_values}"
 
     @pytest.mark.parametrize("lang", EXPECTED_LANGUAGES)
-    def test_translation_preserves_placeholders(self, lang: str) -> None:
+    def test_translation_preserves_placeholders(
+        self,
+        flat_translations: Mapping[str, Mapping[str, Any]],
+        english_placeholders: Mapping[str, frozenset[str]],
+        lang: str,
+    ) -> None:
         """Test that translations preserve placeholders like {host}."""
-        with open(TRANSLATIONS_PATH / "en.json", encoding="utf-8") as f:
-            en_data = json.load(f)
-        with open(TRANSLATIONS_PATH / f"{lang}.json", encoding="utf-8") as f:
-            lang_data = json.load(f)
-
-        def extract_placeholders(s: str) -> set[str]:
-            """Extract {placeholder} patterns from a string."""
-            import re
-
-            return set(re.findall(r"\{(\w+)\}", s))
-
-        def check_placeholders(en_dict: dict, lang_dict: dict, path: str = "") -> list[str]:
-            """Check that placeholders match between translations."""
-            mismatches = []
-            for key, en_value in en_dict.items():
-                current_path = f"{path}.{key}" if path else key
-                lang_value = lang_dict.get(key)
-                if isinstance(en_value, dict) and isinstance(lang_value, dict):
-                    mismatches.extend(check_placeholders(en_value, lang_value, current_path))
-                elif isinstance(en_value, str) and isinstance(lang_value, str):
-                    en_placeholders = extract_placeholders(en_value)
-                    lang_placeholders = extract_placeholders(lang_value)
-                    if en_placeholders != lang_placeholders:
-                        mismatches.append(
-                            f"{current_path}: English has {en_placeholders}, "
-                            f"{lang} has {lang_placeholders}"
-                        )
-            return mismatches
-
-        mismatches = check_placeholders(en_data, lang_data)
+        flat = flat_translations[lang]
+        mismatches = []
+        for path, en in english_placeholders.items():
+            value = flat.get(path)
+            if not isinstance(value, str):
+                continue
+            found = frozenset(_PLACEHOLDER_RE.findall(value))
+            if found != en:
+                mismatches.append(f"{path}: English has {set(en)}, {lang} has {set(found)}")
         assert not mismatches, f"Placeholder mismatches in {lang}.json:\n" + "\n".join(mismatches)
 
 
@@ -146,22 +157,16 @@ class TestEntityTranslations:
     """Test entity-specific translations."""
 
     @pytest.mark.parametrize("lang", EXPECTED_LANGUAGES)
-    def test_all_sensors_have_names(self, lang: str) -> None:
+    def test_all_sensors_have_names(self, translations: Mapping[str, dict], lang: str) -> None:
         """Test that all sensors have name translations."""
-        with open(TRANSLATIONS_PATH / f"{lang}.json", encoding="utf-8") as f:
-            data = json.load(f)
-
-        sensors = data.get("entity", {}).get("sensor", {})
+        sensors = translations[lang].get("entity", {}).get("sensor", {})
         assert sensors, f"No sensor translations in {lang}.json"
 
         for sensor_key, sensor_data in sensors.items():
             assert "name" in sensor_data, f"Missing name for sensor {sensor_key} in {lang}.json"
             assert sensor_data["name"], f"Empty name for sensor {sensor_key} in {lang}.json"
 
-    def test_schedule_sensor_renamed(self) -> None:
+    def test_schedule_sensor_renamed(self, translations: Mapping[str, dict]) -> None:
         """Test that schedule_mode sensor is named 'Schedule' (not 'Schedule Mode')."""
-        with open(TRANSLATIONS_PATH / "en.json", encoding="utf-8") as f:
-            data = json.load(f)
-
-        schedule_name = data["entity"]["sensor"]["schedule_mode"]["name"]
+        schedule_name = translations["en"]["entity"]["sensor"]["schedule_mode"]["name"]
         assert schedule_name == "Schedule", f"Expected 'Schedule', got '{schedule_name}'"